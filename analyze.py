@@ -4,22 +4,24 @@ analyze.py - Módulo de análisis del ETL de Videojuegos
 Contiene la lógica principal del pipeline de análisis
 """
 
-import sys
-import os
 import logging
+import os
 from datetime import datetime
 
-# Agregar paths al PYTHONPATH
-sys.path.append(os.path.join(os.path.dirname(__file__), 'extract'))
-sys.path.append(os.path.join(os.path.dirname(__file__), 'tranform'))
-sys.path.append(os.path.join(os.path.dirname(__file__), 'load'))
-
 from extract import DataExtractor
 from transform import DataTransformer
-from load import DataLoader
+
+# DataLoader se importa de forma diferida dentro de la fase de carga:
+# arrastra matplotlib (~1s de arranque) que las fases de
+# extracción/transformación no necesitan
 
 logger = logging.getLogger(__name__)
 
+# Columnas del CSV que realmente usa el análisis; cargar solo estas
+# reduce el pico de memoria (se omiten Summary, Developers, etc.)
+ANALYSIS_COLUMNS = ['Title', 'Release_Date', 'Platforms', 'Genres',
+                    'Rating', 'Plays']
+
 
 class VideoGameAnalyzer:
     """Clase que encapsula todo el proceso de análisis de videojuegos"""
@@ -40,56 +42,45 @@ class VideoGameAnalyzer:
         """Fase 1: Extracción de datos"""
         logger.info("Iniciando fase de extracción...")
         
-        self.extractor = DataExtractor(self.csv_path)
+        self.extractor = DataExtractor(self.csv_path, usecols=ANALYSIS_COLUMNS)
         self.df = self.extractor.extract_data()
-        
-        data_info = self.extractor.get_data_info(self.df)
-        
+
+        # Metadatos directos del frame: get_data_info recorre todo el
+        # DataFrame contando nulos, que aquí no se consume
         self.results['extraction'] = {
-            'total_records': data_info['total_records'],
-            'columns_count': len(data_info['columns']),
-            'columns': data_info['columns']
+            'total_records': len(self.df),
+            'columns_count': self.df.shape[1],
+            'columns': list(self.df.columns)
         }
-        
-        logger.info(f"Extracción completada: {data_info['total_records']:,} registros")
+
+        logger.info(f"Extracción completada: {len(self.df):,} registros")
         return self.df
     
     def transform_and_analyze(self):
         """Fase 2: Transformación y análisis de datos"""
         logger.info("Iniciando fase de transformación y análisis...")
         
-        self.transformer = DataTransformer(self.df)
-        
-        # Análisis 1: Juego más jugado
-        logger.info("Analizando juego más jugado...")
-        most_played = self.transformer.get_most_played_game()
-        
-        # Análisis 2: Top 20 géneros más jugados
-        logger.info("Calculando top 20 géneros más jugados...")
-        genres_df = self.transformer.get_top_genres(top_n=20)
-        
-        # Análisis 3: Ratings por género
-        logger.info("Analizando ratings por género...")
-        ratings_summary = self.transformer.get_genre_rating_summary(genres_df)
-        
-        # Estadísticas generales
-        logger.info("Calculando estadísticas generales...")
-        stats = self.transformer.get_summary_statistics()
-        
-        self.results['analysis'] = {
-            'most_played': most_played,
-            'genres_df': genres_df,
-            'ratings_summary': ratings_summary,
-            'stats': stats
-        }
-        
+        # El caché Feather junto al CSV amortiza la limpieza entre
+        # ejecuciones (se revalida por mtime, igual que el caché Parquet
+        # de la extracción)
+        self.transformer = DataTransformer(
+            self.df,
+            cache_path=os.path.splitext(self.csv_path)[0] + '_clean.feather',
+            source_path=self.csv_path
+        )
+
+        # Todos los análisis (juego más jugado, top géneros, ratings por
+        # género y estadísticas) se calculan en una sola pasada fusionada
+        self.results['analysis'] = self.transformer.analyze_all(top_n=20)
+
         logger.info("Análisis completado exitosamente")
         return self.results['analysis']
     
     def load_results(self):
         """Fase 3: Generación de visualizaciones y reportes"""
         logger.info("Iniciando fase de carga y generación de reportes...")
-        
+
+        from load import DataLoader
         self.loader = DataLoader(output_dir=self.output_dir)
         
         analysis = self.results['analysis']
@@ -124,25 +115,26 @@ class VideoGameAnalyzer:
         
         logger.info(f"Categorías seleccionadas: {', '.join(top_genres)}")
         
-        # Obtener top juegos para cada género
-        top_games_dict = self.transformer.get_top_games_multiple_genres(top_genres, top_n_games)
-        
+        # Obtener top juegos para todos los géneros en una sola tabla
+        top_games = self.transformer.get_top_games_multiple_genres(top_genres, top_n_games)
+
         # Generar visualizaciones
         logger.info("Generando visualizaciones de top juegos...")
-        
+
         # Crear loader si no existe
         if not hasattr(self, 'loader'):
+            from load import DataLoader
             self.loader = DataLoader(output_dir=self.output_dir)
-        
+
         # Gráficos individuales para cada género
-        individual_charts = self.loader.plot_top_games_multiple_genres(top_games_dict)
-        
+        individual_charts = self.loader.plot_top_games_multiple_genres(top_games)
+
         # Gráfico combinado
-        combined_chart = self.loader.plot_combined_top_games(top_games_dict)
-        
+        combined_chart = self.loader.plot_combined_top_games(top_games)
+
         self.results['top_games_analysis'] = {
             'top_genres': top_genres,
-            'top_games_dict': top_games_dict,
+            'top_games': top_games,
             'individual_charts': individual_charts,
             'combined_chart': combined_chart
         }
@@ -225,14 +217,14 @@ class VideoGameAnalyzer:
         # Top géneros
         genres_df = analysis['genres_df']
         print(f"\n✓ Top 3 géneros más jugados:")
-        for idx, row in genres_df.head(3).iterrows():
-            print(f"  {idx+1}. {row['Genre']}: {row['Total_Plays']:,} jugadas")
-        
+        for i, row in enumerate(genres_df.head(3).to_dict(orient='records'), 1):
+            print(f"  {i}. {row['Genre']}: {row['Total_Plays']:,} jugadas")
+
         # Ratings por género
         ratings_summary = analysis['ratings_summary']
         print(f"\n✓ Top 3 géneros mejor valorados:")
-        for idx, row in ratings_summary.head(3).iterrows():
-            print(f"  {idx+1}. {row['Genre']}: {row['Average_Rating']:.2f}/5.0")
+        for i, row in enumerate(ratings_summary.head(3).to_dict(orient='records'), 1):
+            print(f"  {i}. {row['Genre']}: {row['Average_Rating']:.2f}/5.0")
         
         # Estadísticas generales
         stats = analysis['stats']
@@ -0,0 +1,5 @@
+"""Paquete de extracción del ETL"""
+
+from .extract import DataExtractor
+
+__all__ = ['DataExtractor']
@@ -5,6 +5,7 @@ Extrae datos del archivo CSV de videojuegos
 
 import pandas as pd
 import logging
+import os
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -13,28 +14,118 @@ logger = logging.getLogger(__name__)
 class DataExtractor:
     """Clase para extraer datos del CSV"""
     
-    def __init__(self, file_path):
+    def __init__(self, file_path, usecols=None):
         """
         Inicializa el extractor con la ruta del archivo
-        
+
         Args:
             file_path (str): Ruta al archivo CSV
+            usecols (list, optional): Columnas a cargar. Si se especifica,
+                solo se materializan esas columnas (reduce memoria y tiempo
+                de lectura). Si es None, se carga el archivo completo.
         """
         self.file_path = file_path
-        
+        self.usecols = usecols
+        self.parquet_path = os.path.splitext(file_path)[0] + '.parquet'
+
+    def _optimize_dtypes(self, df):
+        """
+        Reduce la memoria del DataFrame codificando columnas repetitivas
+
+        Las columnas de baja cardinalidad (combinaciones de géneros y
+        plataformas se repiten miles de veces) se convierten a dtype
+        category: cada valor pasa a ser un código entero sobre un
+        diccionario compartido, lo que además acelera los group-by.
+        Las columnas de texto de alta cardinalidad (Title, Plays) quedan
+        con el dtype string por defecto de pandas, que con PyArrow
+        instalado almacena buffers UTF-8 contiguos y despacha los .str.*
+        a kernels de Arrow.
+
+        Args:
+            df (pd.DataFrame): DataFrame recién extraído
+
+        Returns:
+            pd.DataFrame: El mismo DataFrame con dtypes optimizados
+        """
+        before = df.memory_usage(deep=True).sum()
+        for col in ('Genres', 'Platforms'):
+            if col in df.columns:
+                df[col] = df[col].astype('category')
+        after = df.memory_usage(deep=True).sum()
+        logger.info(f"Memoria del DataFrame: {before / 1e6:.1f} MB -> {after / 1e6:.1f} MB")
+        return df
+
+    def _cache_is_valid(self):
+        """
+        Comprueba si el caché Parquet sirve para esta extracción
+
+        Además de ser más reciente que el CSV, el caché debe contener
+        todas las columnas que pide este extractor: el sidecar se
+        escribe desde el frame ya proyectado con usecols, así que un
+        caché dejado por una extracción parcial no puede responder a
+        una petición del archivo completo (usecols=None) ni a una
+        proyección más ancha — en esos casos se vuelve al CSV y el
+        sidecar se reescribe con las columnas nuevas.
+
+        Returns:
+            bool: True si el caché puede usarse en lugar del CSV
+        """
+        if not (os.path.exists(self.parquet_path)
+                and os.path.getmtime(self.parquet_path) >= os.path.getmtime(self.file_path)):
+            return False
+        try:
+            import pyarrow.parquet as pq
+            cached_cols = set(pq.read_schema(self.parquet_path).names)
+        except Exception as e:
+            logger.warning(f"No se pudo leer el esquema del caché Parquet ({e}); se reprocesa el CSV")
+            return False
+        if self.usecols is not None:
+            return set(self.usecols) <= cached_cols
+        # Contrato de usecols=None (archivo completo): el caché debe
+        # cubrir la cabecera real del CSV (lectura de 0 filas)
+        csv_cols = pd.read_csv(self.file_path, nrows=0, index_col=0).columns
+        return set(csv_cols) <= cached_cols
+
     def extract_data(self):
         """
         Extrae datos del CSV y devuelve un DataFrame
-        
+
+        La primera extracción deja un caché Parquet junto al CSV; las
+        siguientes ejecuciones leen el caché (formato binario tipado,
+        mucho más rápido que re-parsear el texto) mientras el CSV no
+        haya cambiado.
+
         Returns:
             pd.DataFrame: DataFrame con los datos extraídos
         """
         try:
+            if self._cache_is_valid():
+                try:
+                    logger.info(f"Leyendo caché Parquet: {self.parquet_path}")
+                    df = pd.read_parquet(self.parquet_path, columns=self.usecols)
+                    logger.info(f"Datos extraídos exitosamente. Registros: {len(df)}")
+                    logger.info(f"Columnas: {list(df.columns)}")
+                    return self._optimize_dtypes(df)
+                except Exception as e:
+                    logger.warning(f"Caché Parquet inutilizable ({e}); se reprocesa el CSV")
+
             logger.info(f"Extrayendo datos desde: {self.file_path}")
-            df = pd.read_csv(self.file_path, index_col=0)
+            if self.usecols is not None:
+                # Proyección de columnas: el parser solo materializa las
+                # columnas referenciadas por el análisis
+                df = pd.read_csv(self.file_path, usecols=self.usecols)
+            else:
+                df = pd.read_csv(self.file_path, index_col=0)
             logger.info(f"Datos extraídos exitosamente. Registros: {len(df)}")
             logger.info(f"Columnas: {list(df.columns)}")
-            return df
+
+            try:
+                df.to_parquet(self.parquet_path)
+                logger.info(f"Caché Parquet escrito en: {self.parquet_path}")
+            except Exception as e:
+                logger.warning(f"No se pudo escribir el caché Parquet: {e}")
+
+            return self._optimize_dtypes(df)
         except FileNotFoundError:
             logger.error(f"Archivo no encontrado: {self.file_path}")
             raise
@@ -42,6 +133,33 @@ class DataExtractor:
             logger.error(f"Error al extraer datos: {str(e)}")
             raise
     
+    def iter_batches(self, batch_size=65536):
+        """
+        Extrae el CSV en lotes en lugar de un único DataFrame
+
+        Permite a consumidores con memoria limitada acumular agregados
+        incrementales (sumas, top-N) sin materializar todas las filas a
+        la vez: el pico de memoria queda acotado por batch_size.
+
+        Args:
+            batch_size (int): Número de filas por lote
+
+        Yields:
+            pd.DataFrame: Lotes sucesivos con las columnas solicitadas
+        """
+        logger.info(f"Extrayendo {self.file_path} en lotes de {batch_size} filas...")
+        try:
+            with pd.read_csv(self.file_path, usecols=self.usecols,
+                             chunksize=batch_size) as reader:
+                for batch in reader:
+                    yield batch
+        except FileNotFoundError:
+            logger.error(f"Archivo no encontrado: {self.file_path}")
+            raise
+        except Exception as e:
+            logger.error(f"Error al extraer datos por lotes: {str(e)}")
+            raise
+
     def get_data_info(self, df):
         """
         Obtiene información básica del DataFrame
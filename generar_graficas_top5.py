@@ -45,8 +45,8 @@ def main():
         top_6_genres = genres_df.head(6)
         
         print("   ✓ Top 6 Categorías principales:")
-        for idx, row in top_6_genres.iterrows():
-            print(f"      {idx+1}. {row['Genre']}: {row['Total_Plays']:,} jugadas")
+        for i, row in enumerate(top_6_genres.to_dict(orient='records'), 1):
+            print(f"      {i}. {row['Genre']}: {row['Total_Plays']:,} jugadas")
         print()
         
         # Fase 3: Análisis específico de top 5 juegos por categoría
@@ -55,9 +55,9 @@ def main():
         
         # Mostrar resumen de juegos encontrados
         print("\n   ✓ Top 5 juegos por categoría:\n")
-        for genre, games_df in results['top_games_dict'].items():
+        for genre, games_df in results['top_games'].groupby('Genre', observed=True, sort=False):
             print(f"   📂 {genre}:")
-            for idx, (_, row) in enumerate(games_df.iterrows(), 1):
+            for idx, row in enumerate(games_df.to_dict(orient='records'), 1):
                 print(f"      {idx}. {row['Title']}: {row['Plays']} jugadas (★{row['Rating']:.1f})")
             print()
         
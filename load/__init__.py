@@ -0,0 +1,5 @@
+"""Paquete de carga del ETL"""
+
+from .load import DataLoader
+
+__all__ = ['DataLoader']
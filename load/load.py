@@ -3,40 +3,236 @@ load.py - Módulo de Carga del ETL
 Genera visualizaciones y reportes de los datos transformados
 """
 
+import functools
+import hashlib
+
+import matplotlib
+# Backend de rasterizado puro: evita inicializar un backend gráfico
+# (Tk/Qt) que no se usa y que además estorba al pool de procesos
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
-import seaborn as sns
+import numpy as np
 import pandas as pd
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.ticker import StrMethodFormatter
 import logging
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
 import os
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-# Configurar estilo de gráficos
-sns.set_style("whitegrid")
-plt.rcParams['figure.figsize'] = (12, 8)
-plt.rcParams['font.size'] = 10
+# Configurar estilo de gráficos: equivalente al "whitegrid" de seaborn
+# aplicado directamente sobre rcParams (seaborn solo se usaba para esto
+# y su import añadía cientos de ms al arranque)
+plt.rcParams.update({
+    'axes.grid': True,
+    'grid.color': '.8',
+    'grid.linestyle': '-',
+    'axes.facecolor': 'white',
+    'axes.edgecolor': '.8',
+    'axes.axisbelow': True,
+    'axes.labelcolor': '.15',
+    'text.color': '.15',
+    'xtick.color': '.15',
+    'ytick.color': '.15',
+    'xtick.bottom': False,
+    'ytick.left': False,
+    'figure.figsize': (12, 8),
+    'font.size': 10,
+})
+
+# Resolución de guardado: 150 DPI es suficiente para las gráficas
+# generadas (se consumen como imágenes de pantalla) y el coste de
+# rasterizado crece cuadráticamente con el DPI
+SAVE_DPI = 150
+
+# Nivel de compresión zlib para los PNG: 1 comprime varias veces más
+# rápido que el nivel por defecto (6) a cambio de archivos algo mayores,
+# buen intercambio para gráficas que se regeneran en cada ejecución
+SAVE_PIL_KWARGS = {'compress_level': 1}
+
+# Formateadores de ejes compartidos: se construyen una sola vez a nivel
+# de módulo en lugar de crear un FuncFormatter (y su lambda) por gráfica.
+# El separador de miles usa StrMethodFormatter, que formatea sin pasar
+# por una lambda de Python en cada tick; las variantes "K" mantienen
+# FuncFormatter porque su lógica no se expresa como format-spec
+FMT_MILES = StrMethodFormatter('{x:,.0f}')
+FMT_MILES_K = plt.FuncFormatter(lambda x, p: f'{int(x/1000)}K')
+FMT_K_ADAPTATIVO = plt.FuncFormatter(
+    lambda x, p: f'{int(x/1000)}K' if x >= 1000 else f'{int(x)}')
+
+
+@functools.lru_cache(maxsize=32)
+def _cmap_colors(cmap_name, n):
+    """
+    Devuelve los primeros n colores de un colormap, memoizados
+
+    Evita reconstruir el array de colores (lookup + normalización) cada
+    vez que se dibuja una gráfica con el mismo colormap y tamaño.
+
+    Args:
+        cmap_name (str): Nombre del colormap de matplotlib
+        n (int): Número de colores a extraer
+
+    Returns:
+        np.ndarray: Array (n, 4) de colores RGBA
+    """
+    return plt.get_cmap(cmap_name)(np.arange(n))
+
+
+@functools.lru_cache(maxsize=32)
+def _cmap_colors_tail(cmap_name, n):
+    """
+    Devuelve n colores del extremo superior (más intenso) de un colormap
+
+    Memoizado igual que _cmap_colors; lo usa el gráfico combinado, que
+    colorea cada género con la franja alta de un colormap distinto.
+
+    Args:
+        cmap_name (str): Nombre del colormap de matplotlib
+        n (int): Número de barras a colorear
+
+    Returns:
+        np.ndarray: Array de colores RGBA
+    """
+    return plt.get_cmap(cmap_name)(range(220, 256, 256 // n))
+
+
+@functools.lru_cache(maxsize=64)
+def _safe_genre_stem(genre):
+    """
+    Convierte un nombre de género en un nombre de archivo seguro
+
+    Memoizado: los mismos géneros se sanitizan una sola vez por proceso.
+
+    Args:
+        genre (str): Nombre del género
+
+    Returns:
+        str: Nombre apto para usar en rutas de archivo
+    """
+    return genre.replace(' ', '_').replace('&', 'and').lower()
 
 
 class DataLoader:
     """Clase para cargar datos y generar visualizaciones"""
     
-    def __init__(self, output_dir='output'):
+    def __init__(self, output_dir='output', image_format='png'):
         """
         Inicializa el loader con un directorio de salida
-        
+
         Args:
             output_dir (str): Directorio donde guardar los outputs
+            image_format (str): Formato de las gráficas ('png' o 'svg').
+                'svg' genera vectores: sin coste de rasterizado y
+                archivos mucho más pequeños para gráficas de barras/torta
         """
         self.output_dir = output_dir
+        self.image_format = image_format
+        # Figuras reutilizables por tamaño: evita crear y destruir una
+        # Figure/Axes nueva (y su coste de asignación) en cada gráfica
+        self._fig_cache = {}
+        # Marcadores de contenido para saltar re-encodes de gráficas
+        # cuyos datos no cambiaron desde la ejecución anterior
+        self._cache_dir = os.path.join(output_dir, '.cache')
         self._create_output_dir()
+
+    def _top_games_digest(self, genre, top_games_df):
+        """
+        Hash del contenido que alimenta la gráfica de un género
+
+        Args:
+            genre (str): Nombre del género
+            top_games_df (pd.DataFrame): Datos que alimentan la gráfica
+
+        Returns:
+            str: Digest hexadecimal de los datos dibujados
+        """
+        payload = repr((genre,
+                        top_games_df['Title'].tolist(),
+                        top_games_df['Plays'].tolist(),
+                        top_games_df['Rating'].tolist())).encode()
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+    def _top_games_marker(self, genre):
+        """
+        Ruta del marcador de contenido de la gráfica de un género
+
+        Hay un único marcador por gráfica (mismo nombre base que el
+        archivo de salida) y su contenido es el hash de los datos
+        dibujados: se sobrescribe en cada render, de modo que siempre
+        describe la versión del gráfico que está en disco y el caché no
+        acumula hashes muertos.
+
+        Args:
+            genre (str): Nombre del género
+
+        Returns:
+            str: Ruta del archivo marcador
+        """
+        return os.path.join(self._cache_dir,
+                            f'top_5_juegos_{_safe_genre_stem(genre)}.hash')
+
+    def _chart_is_fresh(self, marker_path, output_path, digest):
+        """
+        Comprueba si la gráfica en disco corresponde a estos datos
+
+        Args:
+            marker_path (str): Ruta del marcador de contenido
+            output_path (str): Ruta de la gráfica ya escrita
+            digest (str): Hash de los datos que se quieren dibujar
+
+        Returns:
+            bool: True si el marcador registra exactamente este digest
+        """
+        if not (os.path.exists(marker_path) and os.path.exists(output_path)):
+            return False
+        try:
+            with open(marker_path) as f:
+                return f.read().strip() == digest
+        except OSError:
+            return False
+
+    def _save_figure_and_mark(self, fig, output_path, marker_path, digest):
+        """Guarda una figura y registra el digest de sus datos"""
+        self._save_figure(fig, output_path)
+        with open(marker_path, 'w') as f:
+            f.write(digest)
+        return output_path
+
+    def _get_figure(self, figsize):
+        """
+        Devuelve una figura limpia del tamaño pedido, reutilizando la
+        ya creada para ese tamaño si existe
+
+        Args:
+            figsize (tuple): Tamaño de la figura en pulgadas
+
+        Returns:
+            matplotlib.figure.Figure: Figura vacía lista para dibujar
+        """
+        fig = self._fig_cache.get(figsize)
+        if fig is None:
+            fig = plt.figure(figsize=figsize)
+            self._fig_cache[figsize] = fig
+        else:
+            plt.figure(fig.number)  # reactivarla como figura actual de pyplot
+            fig.clf()
+        return fig
+
+    def _image_path(self, stem):
+        """Construye la ruta de salida de una gráfica con el formato configurado"""
+        return os.path.join(self.output_dir, f'{stem}.{self.image_format}')
         
     def _create_output_dir(self):
         """Crea el directorio de salida si no existe"""
         if not os.path.exists(self.output_dir):
             os.makedirs(self.output_dir)
-            logger.info(f"Directorio de salida creado: {self.output_dir}")
+            logger.info("Directorio de salida creado: %s", self.output_dir)
+        os.makedirs(self._cache_dir, exist_ok=True)
     
     def generate_text_report(self, most_played, stats, genres_df, ratings_summary):
         """
@@ -49,55 +245,69 @@ class DataLoader:
             ratings_summary (pd.DataFrame): DataFrame con ratings por género
         """
         logger.info("Generando reporte textual...")
-        
+
         report_path = os.path.join(self.output_dir, 'analisis_videojuegos.txt')
-        
-        with open(report_path, 'w', encoding='utf-8') as f:
-            f.write("=" * 80 + "\n")
-            f.write("ANÁLISIS DE VIDEOJUEGOS - BACKLOGGD\n")
-            f.write("=" * 80 + "\n")
-            f.write(f"Fecha de generación: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-            
+
+        # Componer el reporte completo en memoria y escribirlo de una
+        # sola vez, en lugar de decenas de f.write pequeños
+        separator = "=" * 80 + "\n"
+        divider = "-" * 80 + "\n"
+
+        parts = [
+            separator,
+            "ANÁLISIS DE VIDEOJUEGOS - BACKLOGGD\n",
+            separator,
+            f"Fecha de generación: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n",
+
             # Estadísticas generales
-            f.write("ESTADÍSTICAS GENERALES\n")
-            f.write("-" * 80 + "\n")
-            f.write(f"Total de juegos: {stats['total_games']:,}\n")
-            f.write(f"Total de jugadas: {stats['total_plays']:,}\n")
-            f.write(f"Rating promedio: {stats['average_rating']:.2f}\n")
-            f.write(f"Rating máximo: {stats['max_rating']:.2f}\n")
-            f.write(f"Rating mínimo: {stats['min_rating']:.2f}\n")
-            f.write(f"Géneros únicos: {stats['unique_genres']}\n\n")
-            
+            "ESTADÍSTICAS GENERALES\n",
+            divider,
+            f"Total de juegos: {stats['total_games']:,}\n",
+            f"Total de jugadas: {stats['total_plays']:,}\n",
+            f"Rating promedio: {stats['average_rating']:.2f}\n",
+            f"Rating máximo: {stats['max_rating']:.2f}\n",
+            f"Rating mínimo: {stats['min_rating']:.2f}\n",
+            f"Géneros únicos: {stats['unique_genres']}\n\n",
+
             # Juego más jugado
-            f.write("JUEGO MÁS JUGADO\n")
-            f.write("-" * 80 + "\n")
-            f.write(f"Título: {most_played['title']}\n")
-            f.write(f"Número de jugadas: {most_played['plays']}\n")
-            f.write(f"Rating: {most_played['rating']:.2f}\n")
-            f.write(f"Géneros: {most_played['genres']}\n")
-            f.write(f"Plataformas: {most_played['platforms']}\n")
-            f.write(f"Fecha de lanzamiento: {most_played['release_date']}\n\n")
-            
+            "JUEGO MÁS JUGADO\n",
+            divider,
+            f"Título: {most_played['title']}\n",
+            f"Número de jugadas: {most_played['plays']}\n",
+            f"Rating: {most_played['rating']:.2f}\n",
+            f"Géneros: {most_played['genres']}\n",
+            f"Plataformas: {most_played['platforms']}\n",
+            f"Fecha de lanzamiento: {most_played['release_date']}\n\n",
+
             # Top 20 géneros más jugados
-            f.write("TOP 20 GÉNEROS MÁS JUGADOS\n")
-            f.write("-" * 80 + "\n")
-            for idx, row in genres_df.iterrows():
-                f.write(f"{idx+1}. {row['Genre']}: {row['Total_Plays']:,} jugadas\n")
-            f.write("\n")
-            
-            # Ratings promedio por género
-            f.write("RATINGS PROMEDIO POR GÉNERO (TOP 20 GÉNEROS)\n")
-            f.write("-" * 80 + "\n")
-            for idx, row in ratings_summary.iterrows():
-                f.write(f"{row['Genre']}: {row['Average_Rating']:.2f} ")
-                f.write(f"({row['Game_Count']} juegos)\n")
-            f.write("\n")
-            
-            f.write("=" * 80 + "\n")
-            f.write("Fin del reporte\n")
-            f.write("=" * 80 + "\n")
-        
-        logger.info(f"Reporte textual guardado en: {report_path}")
+            "TOP 20 GÉNEROS MÁS JUGADOS\n",
+            divider,
+        ]
+        parts.extend(
+            f"{i}. {genre}: {plays:,} jugadas\n"
+            for i, (genre, plays) in enumerate(
+                zip(genres_df['Genre'], genres_df['Total_Plays']), 1)
+        )
+
+        # Ratings promedio por género
+        parts.append("\nRATINGS PROMEDIO POR GÉNERO (TOP 20 GÉNEROS)\n")
+        parts.append(divider)
+        parts.extend(
+            f"{genre}: {rating:.2f} ({count} juegos)\n"
+            for genre, rating, count in zip(ratings_summary['Genre'],
+                                            ratings_summary['Average_Rating'],
+                                            ratings_summary['Game_Count'])
+        )
+
+        parts.append("\n")
+        parts.append(separator)
+        parts.append("Fin del reporte\n")
+        parts.append(separator)
+
+        with open(report_path, 'w', encoding='utf-8') as f:
+            f.writelines(parts)
+
+        logger.info("Reporte textual guardado en: %s", report_path)
         return report_path
     
     def plot_most_played_game(self, most_played):
@@ -108,11 +318,12 @@ class DataLoader:
             most_played (dict): Información del juego más jugado
         """
         logger.info("Generando gráfico del juego más jugado...")
-        
-        fig, ax = plt.subplots(figsize=(10, 6))
+
+        fig = self._get_figure((10, 6))
+        ax = fig.add_subplot(111)
         
         # Crear un gráfico de barra simple para destacar el juego
-        ax.barh([0], [most_played['plays_numeric']], color='#1f77b4', height=0.5)
+        bars = ax.barh([0], [most_played['plays_numeric']], color='#1f77b4', height=0.5)
         
         # Configurar etiquetas
         ax.set_yticks([0])
@@ -121,22 +332,18 @@ class DataLoader:
         ax.set_title('JUEGO MÁS JUGADO', fontsize=16, fontweight='bold', pad=20)
         
         # Añadir valor en la barra
-        ax.text(most_played['plays_numeric'], 0, 
-                f" {most_played['plays']} jugadas\n Rating: {most_played['rating']:.1f}/5.0", 
-                va='center', ha='left', fontsize=11, fontweight='bold')
+        ax.bar_label(
+            bars,
+            labels=[f" {most_played['plays']} jugadas\n Rating: {most_played['rating']:.1f}/5.0"],
+            fontsize=11, fontweight='bold')
         
         # Formato del eje x
         ax.ticklabel_format(style='plain', axis='x')
-        ax.xaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'{int(x):,}'))
+        ax.xaxis.set_major_formatter(FMT_MILES)
         
         plt.tight_layout()
         
-        output_path = os.path.join(self.output_dir, 'juego_mas_jugado.png')
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
-        
-        logger.info(f"Gráfico guardado en: {output_path}")
-        return output_path
+        return self._save_figure(fig, self._image_path('juego_mas_jugado'))
     
     def plot_top_genres(self, genres_df):
         """
@@ -146,12 +353,13 @@ class DataLoader:
             genres_df (pd.DataFrame): DataFrame con géneros y jugadas
         """
         logger.info("Generando gráfico de top géneros...")
-        
-        fig, ax = plt.subplots(figsize=(14, 10))
+
+        fig = self._get_figure((14, 10))
+        ax = fig.add_subplot(111)
         
         # Crear gráfico de barras horizontal
-        colors = plt.cm.viridis(range(len(genres_df)))
-        bars = ax.barh(range(len(genres_df)), genres_df['Total_Plays'], color=colors)
+        colors = _cmap_colors('viridis', len(genres_df))
+        bars = ax.barh(range(len(genres_df)), genres_df['Total_Plays'].to_numpy(), color=colors)
         
         # Configurar etiquetas
         ax.set_yticks(range(len(genres_df)))
@@ -160,25 +368,20 @@ class DataLoader:
         ax.set_title('TOP 20 GÉNEROS MÁS JUGADOS', fontsize=16, fontweight='bold', pad=20)
         
         # Añadir valores en las barras
-        for i, (idx, row) in enumerate(genres_df.iterrows()):
-            ax.text(row['Total_Plays'], i, f" {row['Total_Plays']:,.0f}", 
-                   va='center', ha='left', fontsize=9)
+        ax.bar_label(bars, labels=[f" {plays:,.0f}"
+                                   for plays in genres_df['Total_Plays'].to_numpy()],
+                     fontsize=9)
         
         # Formato del eje x
         ax.ticklabel_format(style='plain', axis='x')
-        ax.xaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'{int(x/1000)}K'))
+        ax.xaxis.set_major_formatter(FMT_MILES_K)
         
         # Invertir para que el más jugado esté arriba
         ax.invert_yaxis()
         
         plt.tight_layout()
         
-        output_path = os.path.join(self.output_dir, 'top_20_generos.png')
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
-        
-        logger.info(f"Gráfico guardado en: {output_path}")
-        return output_path
+        return self._save_figure(fig, self._image_path('top_20_generos'))
     
     def plot_genre_ratings_pie(self, ratings_summary, top_n=15):
         """
@@ -190,16 +393,20 @@ class DataLoader:
         """
         logger.info("Generando gráfico de torta de ratings...")
         
-        # Tomar solo los top N mejor valorados
-        top_ratings = ratings_summary.head(top_n).copy()
-        
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(18, 9))
-        
+        # Tomar solo los top N mejor valorados y extraer las columnas a
+        # arrays una sola vez; torta y barras comparten los mismos datos
+        top_ratings = ratings_summary.head(top_n)
+        genres = top_ratings['Genre'].to_numpy()
+        ratings = top_ratings['Average_Rating'].to_numpy()
+
+        fig = self._get_figure((18, 9))
+        ax1, ax2 = fig.subplots(1, 2)
+
         # Gráfico de torta
-        colors = plt.cm.Set3(range(len(top_ratings)))
+        colors = _cmap_colors('Set3', len(genres))
         wedges, texts, autotexts = ax1.pie(
-            top_ratings['Average_Rating'], 
-            labels=top_ratings['Genre'],
+            ratings,
+            labels=genres,
             autopct='%1.1f%%',
             startangle=90,
             colors=colors,
@@ -210,10 +417,10 @@ class DataLoader:
                      fontsize=14, fontweight='bold', pad=20)
         
         # Gráfico de barras complementario
-        bars = ax2.barh(range(len(top_ratings)), top_ratings['Average_Rating'], 
+        bars = ax2.barh(range(len(genres)), ratings,
                        color=colors, edgecolor='black', linewidth=0.5)
-        ax2.set_yticks(range(len(top_ratings)))
-        ax2.set_yticklabels(top_ratings['Genre'], fontsize=10)
+        ax2.set_yticks(range(len(genres)))
+        ax2.set_yticklabels(genres, fontsize=10)
         ax2.set_xlabel('Rating Promedio', fontsize=11, fontweight='bold')
         ax2.set_title(f'Ratings Promedio por Género (Top {top_n})', 
                      fontsize=12, fontweight='bold', pad=15)
@@ -221,21 +428,15 @@ class DataLoader:
         ax2.grid(axis='x', alpha=0.3)
         
         # Añadir valores en las barras
-        for i, (idx, row) in enumerate(top_ratings.iterrows()):
-            ax2.text(row['Average_Rating'], i, f" {row['Average_Rating']:.2f}", 
-                    va='center', ha='left', fontsize=9, fontweight='bold')
+        ax2.bar_label(bars, labels=[f" {rating:.2f}" for rating in ratings],
+                      fontsize=9, fontweight='bold')
         
         # Invertir para que el mejor esté arriba
         ax2.invert_yaxis()
         
         plt.tight_layout()
         
-        output_path = os.path.join(self.output_dir, 'ratings_por_genero_torta.png')
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
-        
-        logger.info(f"Gráfico guardado en: {output_path}")
-        return output_path
+        return self._save_figure(fig, self._image_path('ratings_por_genero_torta'))
     
     def plot_comprehensive_analysis(self, genres_df, ratings_summary):
         """
@@ -247,26 +448,32 @@ class DataLoader:
         """
         logger.info("Generando análisis combinado...")
         
-        # Combinar datos
-        combined = pd.merge(genres_df, ratings_summary, on='Genre', how='inner')
+        # Alinear ratings sobre los géneros más jugados sin construir un
+        # merge intermedio: ambos frames ya están codificados por Genre
+        ratings_by_genre = ratings_summary.set_index('Genre')['Average_Rating']
+        combined = genres_df[genres_df['Genre'].isin(ratings_by_genre.index)]
         combined = combined.head(15)  # Top 15 para mejor visualización
+        genres = combined['Genre'].to_numpy()
+        plays = combined['Total_Plays'].to_numpy()
+        avg_ratings = ratings_by_genre.reindex(combined['Genre']).to_numpy()
         
-        fig, ax1 = plt.subplots(figsize=(14, 8))
+        fig = self._get_figure((14, 8))
+        ax1 = fig.add_subplot(111)
         
         # Eje 1: Total de jugadas (barras)
         color1 = '#3498db'
-        x = range(len(combined))
-        bars = ax1.bar(x, combined['Total_Plays'], color=color1, alpha=0.7, label='Total Jugadas')
+        x = range(len(genres))
+        bars = ax1.bar(x, plays, color=color1, alpha=0.7, label='Total Jugadas')
         ax1.set_xlabel('Género', fontsize=12, fontweight='bold')
         ax1.set_ylabel('Total de Jugadas', color=color1, fontsize=12, fontweight='bold')
         ax1.tick_params(axis='y', labelcolor=color1)
         ax1.set_xticks(x)
-        ax1.set_xticklabels(combined['Genre'], rotation=45, ha='right', fontsize=10)
+        ax1.set_xticklabels(genres, rotation=45, ha='right', fontsize=10)
         
         # Eje 2: Rating promedio (línea)
         ax2 = ax1.twinx()
         color2 = '#e74c3c'
-        line = ax2.plot(x, combined['Average_Rating'], color=color2, marker='o', 
+        line = ax2.plot(x, avg_ratings, color=color2, marker='o',
                        linewidth=2, markersize=8, label='Rating Promedio')
         ax2.set_ylabel('Rating Promedio', color=color2, fontsize=12, fontweight='bold')
         ax2.tick_params(axis='y', labelcolor=color2)
@@ -283,12 +490,7 @@ class DataLoader:
         
         plt.tight_layout()
         
-        output_path = os.path.join(self.output_dir, 'analisis_combinado.png')
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
-        
-        logger.info(f"Gráfico guardado en: {output_path}")
-        return output_path
+        return self._save_figure(fig, self._image_path('analisis_combinado'))
     
     def generate_all_visualizations(self, most_played, stats, genres_df, ratings_summary):
         """
@@ -304,33 +506,77 @@ class DataLoader:
             dict: Diccionario con rutas de los archivos generados
         """
         logger.info("Generando todas las visualizaciones...")
-        
-        outputs = {
-            'text_report': self.generate_text_report(most_played, stats, genres_df, ratings_summary),
-            'most_played_chart': self.plot_most_played_game(most_played),
-            'top_genres_chart': self.plot_top_genres(genres_df),
-            'ratings_pie_chart': self.plot_genre_ratings_pie(ratings_summary),
-            'combined_analysis': self.plot_comprehensive_analysis(genres_df, ratings_summary)
+
+        # Las cinco salidas son independientes entre sí, así que se
+        # renderizan en paralelo en procesos separados (matplotlib es
+        # CPU-bound y no es seguro entre hilos)
+        tasks = {
+            'text_report': (self.generate_text_report, (most_played, stats, genres_df, ratings_summary)),
+            'most_played_chart': (self.plot_most_played_game, (most_played,)),
+            'top_genres_chart': (self.plot_top_genres, (genres_df,)),
+            'ratings_pie_chart': (self.plot_genre_ratings_pie, (ratings_summary,)),
+            'combined_analysis': (self.plot_comprehensive_analysis, (genres_df, ratings_summary))
         }
-        
+
+        with ProcessPoolExecutor(max_workers=len(tasks)) as executor:
+            futures = {name: executor.submit(func, *args)
+                       for name, (func, args) in tasks.items()}
+            outputs = {name: future.result() for name, future in futures.items()}
+
         logger.info("Todas las visualizaciones generadas exitosamente")
         return outputs
     
-    def plot_top_games_by_genre(self, genre, top_games_df):
+    def _save_figure(self, fig, output_path):
         """
-        Genera gráfico de barras para los top 5 juegos de un género
-        
+        Guarda y cierra una figura ya construida
+
+        Separado de la construcción para poder solapar la escritura
+        (compresión PNG + disco) con el armado de la siguiente figura.
+
+        Args:
+            fig (matplotlib.figure.Figure): Figura lista para guardar
+            output_path (str): Ruta del archivo de salida
+        """
+        # Sin bbox_inches='tight': obliga a un dibujado extra completo
+        # para medir extents, y todas las figuras ya ajustan sus márgenes
+        # con plt.tight_layout() antes de llegar aquí
+        save_kwargs = {'pil_kwargs': SAVE_PIL_KWARGS} if self.image_format == 'png' else {}
+        fig.savefig(output_path, dpi=SAVE_DPI, **save_kwargs)
+        # Las figuras del caché de reutilización no se cierran (se
+        # limpian con clf() la próxima vez que se necesite su tamaño) y
+        # las construidas sin pyplot no están registradas en el gestor
+        # global, así que no hay nada que cerrar
+        if (getattr(fig.canvas, 'manager', None) is not None
+                and fig not in self._fig_cache.values()):
+            plt.close(fig)
+        logger.info("Gráfico guardado en: %s", output_path)
+        return output_path
+
+    def _build_top_games_figure(self, genre, top_games_df):
+        """
+        Construye (sin guardar) la figura de top juegos de un género
+
         Args:
             genre (str): Nombre del género
             top_games_df (pd.DataFrame): DataFrame con los top juegos del género
+
+        Returns:
+            tuple: (figura, ruta de salida)
         """
-        logger.info(f"Generando gráfico para género: {genre}")
-        
-        fig, ax = plt.subplots(figsize=(12, 8))
+        logger.info("Generando gráfico para género: %s", genre)
+
+        # Figura construida sin pyplot (ni caché de reutilización): el
+        # guardado corre en un hilo de fondo, y una Figure con canvas
+        # Agg propio no queda registrada en el gestor global de pyplot
+        # (que no es seguro entre hilos), así que el hilo solo toca su
+        # propia figura
+        fig = Figure(figsize=(12, 8))
+        FigureCanvasAgg(fig)
+        ax = fig.add_subplot(111)
         
         # Crear gráfico de barras horizontal
-        colors = plt.cm.plasma(range(len(top_games_df)))
-        bars = ax.barh(range(len(top_games_df)), top_games_df['Plays_numeric'], color=colors, edgecolor='black', linewidth=1.2)
+        colors = _cmap_colors('plasma', len(top_games_df))
+        bars = ax.barh(range(len(top_games_df)), top_games_df['Plays_numeric'].to_numpy(), color=colors, edgecolor='black', linewidth=1.2)
         
         # Configurar etiquetas
         ax.set_yticks(range(len(top_games_df)))
@@ -338,81 +584,115 @@ class DataLoader:
         ax.set_xlabel('Número de Jugadas', fontsize=12, fontweight='bold')
         ax.set_title(f'TOP 5 JUEGOS MÁS JUGADOS - {genre.upper()}', fontsize=16, fontweight='bold', pad=20)
         
-        # Añadir valores en las barras
-        for i, (idx, row) in enumerate(top_games_df.iterrows()):
-            # Añadir jugadas
-            ax.text(row['Plays_numeric'], i, f" {row['Plays']} jugadas", 
-                   va='center', ha='left', fontsize=10, fontweight='bold')
-            # Añadir rating
-            rating_text = f"★ {row['Rating']:.1f}" if pd.notna(row['Rating']) else "★ N/A"
-            ax.text(row['Plays_numeric'] * 0.02, i, rating_text, 
+        # Añadir jugadas al final de cada barra
+        plays_str = top_games_df['Plays'].to_numpy()
+        ax.bar_label(bars, labels=[f" {plays_text} jugadas" for plays_text in plays_str],
+                     fontsize=10, fontweight='bold')
+
+        # Añadir rating dentro de la barra (posición propia, fuera del
+        # alcance de bar_label)
+        plays_num = top_games_df['Plays_numeric'].to_numpy()
+        ratings = top_games_df['Rating'].to_numpy()
+        for i, (plays, rating) in enumerate(zip(plays_num, ratings)):
+            rating_text = f"★ {rating:.1f}" if pd.notna(rating) else "★ N/A"
+            ax.text(plays * 0.02, i, rating_text,
                    va='center', ha='left', fontsize=9, color='white', fontweight='bold',
                    bbox=dict(boxstyle='round,pad=0.3', facecolor='darkblue', alpha=0.7))
         
         # Formato del eje x
         ax.ticklabel_format(style='plain', axis='x')
-        ax.xaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'{int(x):,}'))
+        ax.xaxis.set_major_formatter(FMT_MILES)
         
         # Invertir para que el más jugado esté arriba
         ax.invert_yaxis()
-        
+
         # Añadir grid
         ax.grid(axis='x', alpha=0.3, linestyle='--')
-        
-        plt.tight_layout()
-        
-        # Nombre de archivo seguro
-        safe_genre_name = genre.replace(' ', '_').replace('&', 'and').lower()
-        output_path = os.path.join(self.output_dir, f'top_5_juegos_{safe_genre_name}.png')
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
-        
-        logger.info(f"Gráfico guardado en: {output_path}")
-        return output_path
-    
-    def plot_top_games_multiple_genres(self, top_games_dict):
+
+        fig.tight_layout()
+
+        output_path = self._image_path(f'top_5_juegos_{_safe_genre_stem(genre)}')
+        return fig, output_path
+
+    def plot_top_games_by_genre(self, genre, top_games_df):
+        """
+        Genera gráfico de barras para los top 5 juegos de un género
+
+        Args:
+            genre (str): Nombre del género
+            top_games_df (pd.DataFrame): DataFrame con los top juegos del género
+        """
+        output_path = self._image_path(f'top_5_juegos_{_safe_genre_stem(genre)}')
+        marker_path = self._top_games_marker(genre)
+        digest = self._top_games_digest(genre, top_games_df)
+        if self._chart_is_fresh(marker_path, output_path, digest):
+            logger.info("Gráfico sin cambios, se reutiliza: %s", output_path)
+            return output_path
+
+        fig, output_path = self._build_top_games_figure(genre, top_games_df)
+        return self._save_figure_and_mark(fig, output_path, marker_path, digest)
+
+    def plot_top_games_multiple_genres(self, top_games):
         """
         Genera gráficos para múltiples géneros
-        
+
+        La escritura de cada gráfico se despacha a un hilo de fondo para
+        solaparla con la construcción del siguiente. Las figuras se
+        construyen sin pyplot (Figure + canvas Agg propios), de modo que
+        el guardado es compresión zlib + disco sobre una figura que solo
+        ese hilo conoce, sin tocar el estado global de pyplot.
+
         Args:
-            top_games_dict (dict): Diccionario con género y DataFrame de juegos
-            
+            top_games (pd.DataFrame): Tabla tidy con columna Genre y los
+                top juegos de cada género
+
         Returns:
             list: Lista de rutas de archivos generados
         """
-        logger.info(f"Generando gráficos para {len(top_games_dict)} géneros...")
-        
-        output_paths = []
-        for genre, top_games_df in top_games_dict.items():
-            path = self.plot_top_games_by_genre(genre, top_games_df)
-            output_paths.append(path)
-        
-        logger.info(f"Todos los gráficos generados: {len(output_paths)} archivos")
+        logger.info("Generando gráficos para %d géneros...", top_games['Genre'].nunique())
+
+        with ThreadPoolExecutor(max_workers=2) as save_pool:
+            pending = []
+            for genre, games in top_games.groupby('Genre', observed=True, sort=False):
+                output_path = self._image_path(f'top_5_juegos_{_safe_genre_stem(genre)}')
+                marker_path = self._top_games_marker(genre)
+                digest = self._top_games_digest(genre, games)
+                if self._chart_is_fresh(marker_path, output_path, digest):
+                    logger.info("Gráfico sin cambios, se reutiliza: %s", output_path)
+                    pending.append(output_path)
+                    continue
+                fig, output_path = self._build_top_games_figure(genre, games)
+                pending.append(save_pool.submit(
+                    self._save_figure_and_mark, fig, output_path, marker_path, digest))
+            output_paths = [p if isinstance(p, str) else p.result() for p in pending]
+
+        logger.info("Todos los gráficos generados: %d archivos", len(output_paths))
         return output_paths
     
-    def plot_combined_top_games(self, top_games_dict):
+    def plot_combined_top_games(self, top_games):
         """
         Genera un gráfico combinado con todos los géneros juntos
-        
+
         Args:
-            top_games_dict (dict): Diccionario con género y DataFrame de juegos
+            top_games (pd.DataFrame): Tabla tidy con columna Genre y los
+                top juegos de cada género
         """
         logger.info("Generando gráfico combinado de todos los géneros...")
-        
+
         # Crear figura con subplots
-        num_genres = len(top_games_dict)
-        fig, axes = plt.subplots(2, 3, figsize=(20, 12))
-        axes = axes.flatten()
-        
+        fig = self._get_figure((20, 12))
+        axes = fig.subplots(2, 3).flatten()
+
         # Colores diferentes para cada género
         color_maps = ['Blues', 'Greens', 'Reds', 'Purples', 'Oranges', 'YlOrBr']
-        
-        for idx, (genre, top_games_df) in enumerate(top_games_dict.items()):
+
+        for idx, (genre, top_games_df) in enumerate(
+                top_games.groupby('Genre', observed=True, sort=False)):
             ax = axes[idx]
             
             # Crear gráfico de barras
-            colors = plt.cm.get_cmap(color_maps[idx])(range(220, 256, 256//len(top_games_df)))
-            bars = ax.barh(range(len(top_games_df)), top_games_df['Plays_numeric'], 
+            colors = _cmap_colors_tail(color_maps[idx], len(top_games_df))
+            bars = ax.barh(range(len(top_games_df)), top_games_df['Plays_numeric'].to_numpy(),
                           color=colors, edgecolor='black', linewidth=1)
             
             # Configurar etiquetas
@@ -422,16 +702,16 @@ class DataLoader:
             ax.set_title(f'{genre}', fontsize=11, fontweight='bold', pad=10)
             
             # Añadir valores
-            for i, (_, row) in enumerate(top_games_df.iterrows()):
-                ax.text(row['Plays_numeric'], i, f" {row['Plays']}", 
-                       va='center', ha='left', fontsize=7)
+            ax.bar_label(bars, labels=[f" {plays_text}"
+                                       for plays_text in top_games_df['Plays'].to_numpy()],
+                         fontsize=7)
             
             # Invertir eje Y
             ax.invert_yaxis()
             
             # Formato del eje x
             ax.ticklabel_format(style='plain', axis='x')
-            ax.xaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'{int(x/1000)}K' if x >= 1000 else f'{int(x)}'))
+            ax.xaxis.set_major_formatter(FMT_K_ADAPTATIVO)
             ax.grid(axis='x', alpha=0.2)
         
         # Título general
@@ -440,10 +720,5 @@ class DataLoader:
         
         plt.tight_layout()
         
-        output_path = os.path.join(self.output_dir, 'top_5_juegos_todas_categorias.png')
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
-        
-        logger.info(f"Gráfico combinado guardado en: {output_path}")
-        return output_path
+        return self._save_figure(fig, self._image_path('top_5_juegos_todas_categorias'))
 
@@ -75,14 +75,16 @@ def main():
         print("\n→ Calculando top 20 géneros más jugados...")
         genres_df = analysis['genres_df']
         print(f"  ✓ Top 3 géneros:")
-        for idx, row in genres_df.head(3).iterrows():
-            print(f"    {idx+1}. {row['Genre']}: {row['Total_Plays']:,} jugadas")
+        for i, (genre, plays) in enumerate(zip(genres_df['Genre'].to_numpy()[:3],
+                                               genres_df['Total_Plays'].to_numpy()[:3]), 1):
+            print(f"    {i}. {genre}: {plays:,} jugadas")
         
         print("\n→ Analizando ratings por género...")
         ratings_summary = analysis['ratings_summary']
         print(f"  ✓ Top 3 géneros mejor valorados:")
-        for idx, row in ratings_summary.head(3).iterrows():
-            print(f"    {idx+1}. {row['Genre']}: {row['Average_Rating']:.2f}/5.0")
+        for i, (genre, rating) in enumerate(zip(ratings_summary['Genre'].to_numpy()[:3],
+                                                ratings_summary['Average_Rating'].to_numpy()[:3]), 1):
+            print(f"    {i}. {genre}: {rating:.2f}/5.0")
         
         print("\n→ Calculando estadísticas generales...")
         stats = analysis['stats']
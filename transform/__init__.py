@@ -0,0 +1,5 @@
+"""Paquete de transformación del ETL"""
+
+from .transform import DataTransformer
+
+__all__ = ['DataTransformer']
@@ -0,0 +1,451 @@
+"""
+transform.py - Módulo de Transformación del ETL
+Procesa y transforma los datos extraídos para análisis
+"""
+
+import numpy as np
+import pandas as pd
+import re
+import logging
+import os
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Extrae los nombres de género del literal tipo "['Adventure', 'RPG']".
+# Un findall con regex compilada equivale aquí a ast.literal_eval (los
+# nombres de género no contienen comillas) y evita compilar y recorrer
+# un AST de Python por cada valor
+_GENRE_RE = re.compile(r"'([^']*)'")
+
+
+class DataTransformer:
+    """Clase para transformar y analizar datos de videojuegos"""
+    
+    def __init__(self, df, cache_path=None, source_path=None):
+        """
+        Inicializa el transformador con un DataFrame
+
+        Args:
+            df (pd.DataFrame): DataFrame con los datos a transformar
+            cache_path (str, optional): Ruta a un caché Feather del
+                DataFrame ya limpio. Si existe y es más reciente que
+                source_path, se lee en lugar de repetir la limpieza;
+                si no, la limpieza lo (re)escribe al terminar.
+            source_path (str, optional): Archivo fuente contra el que
+                se valida el caché por fecha de modificación.
+        """
+        # Memoización de resultados por (género, top_n); los datos no
+        # cambian tras la limpieza, así que los resultados son estables
+        self._top_games_cache = {}
+        # Ranking de géneros memoizado por top_n: los distintos análisis
+        # (valoraciones, resumen de ratings) parten del mismo ranking
+        self._top_genres_cache = {}
+        # Tabla (juego, género) explotada, compartida entre análisis
+        self._exploded = None
+        # Posiciones de fila por género sobre la tabla explotada
+        self._genre_positions = None
+        self._cache_path = cache_path
+        self._source_path = source_path
+
+        cleaned = self._read_clean_cache()
+        if cleaned is not None:
+            self.df = cleaned
+        else:
+            # Copia superficial: comparte los buffers de columnas con el
+            # DataFrame de entrada sin tocar cada byte; con copy-on-write
+            # las columnas que añade/convierte la limpieza no afectan al
+            # frame del llamador
+            self.df = df.copy(deep=False)
+            self._clean_data()
+            self._write_clean_cache()
+
+    def _read_clean_cache(self):
+        """
+        Intenta leer el caché Feather del DataFrame limpio
+
+        El caché se considera válido si es más reciente que el archivo
+        fuente, el mismo criterio por mtime que usa el caché Parquet de
+        la extracción. Amortiza la limpieza entre ejecuciones: las
+        conversiones de jugadas/ratings y el parseo de géneros solo se
+        repiten cuando cambia la fuente.
+
+        Returns:
+            pd.DataFrame or None: DataFrame limpio, o None si no hay
+                caché utilizable
+        """
+        if not (self._cache_path and self._source_path):
+            return None
+        try:
+            if (os.path.exists(self._cache_path)
+                    and os.path.getmtime(self._cache_path) >= os.path.getmtime(self._source_path)):
+                logger.info(f"Leyendo datos limpios desde caché: {self._cache_path}")
+                return pd.read_feather(self._cache_path)
+        except Exception as e:
+            logger.warning(f"Caché de datos limpios inutilizable ({e}); se repite la limpieza")
+        return None
+
+    def _write_clean_cache(self):
+        """Escribe el DataFrame limpio al caché Feather (mejor esfuerzo)"""
+        if not self._cache_path:
+            return
+        try:
+            self.df.to_feather(self._cache_path)
+            logger.info(f"Caché de datos limpios escrito en: {self._cache_path}")
+        except Exception as e:
+            logger.warning(f"No se pudo escribir el caché de datos limpios: {e}")
+
+
+    def _clean_data(self):
+        """Limpia y prepara los datos para análisis"""
+        logger.info("Limpiando datos...")
+        
+        # Convertir Plays a valores numéricos (eliminar 'K' y convertir)
+        # de forma vectorizada en lugar de aplicar una función por fila
+        plays = self.df['Plays'].astype(str).str.strip()
+        has_k = plays.str.contains('K', regex=False).to_numpy()
+        numeric = pd.to_numeric(plays.str.replace('K', '', regex=False),
+                                errors='coerce').to_numpy()
+        # Selección sin ramas sobre los arrays crudos: np.where escoge
+        # entre valor y valor*1000 en un único kernel vectorizado, sin
+        # la alineación de índices del where de pandas. int32 basta con
+        # holgura para los conteos de jugadas (máximo observado
+        # ~38K·1000) y mueve la mitad de bytes por celda en todas las
+        # agregaciones posteriores
+        self.df['Plays_numeric'] = np.nan_to_num(
+            np.where(has_k, numeric * 1000, numeric)).astype(np.int32)
+
+        # Convertir Rating a numérico; float32 sobra para una escala
+        # 0-5 con dos decimales
+        self.df['Rating'] = (pd.to_numeric(self.df['Rating'], errors='coerce')
+                             .astype(np.float32))
+        
+        # Parsear géneros (están en formato de lista como string)
+        genres = self.df['Genres']
+        if isinstance(genres.dtype, pd.CategoricalDtype):
+            # Con dtype category basta con parsear cada combinación única
+            # una sola vez y proyectar el resultado por códigos
+            parsed = [_GENRE_RE.findall(value) for value in genres.cat.categories]
+            self.df['Genres_list'] = pd.Series(
+                [parsed[code] if code >= 0 else [] for code in genres.cat.codes],
+                index=self.df.index
+            )
+        else:
+            self.df['Genres_list'] = (genres.fillna('[]').astype(str)
+                                      .str.findall(_GENRE_RE))
+        
+        logger.info("Limpieza de datos completada")
+    
+    def _get_exploded(self):
+        """
+        Devuelve la tabla explotada (una fila por juego y género)
+
+        Se construye una única vez y se reutiliza entre analyze_all y
+        los análisis de top juegos por género, de modo que ejecutar
+        varias fases sobre el mismo transformador no repita el explode.
+
+        Returns:
+            pd.DataFrame: Tabla con Title, Plays, Plays_numeric, Rating
+                y Genres_list explotado
+        """
+        if self._exploded is None:
+            self._exploded = (self.df[['Title', 'Plays', 'Plays_numeric',
+                                       'Rating', 'Genres_list']]
+                              .explode('Genres_list'))
+        return self._exploded
+
+    def _get_genre_positions(self):
+        """
+        Devuelve el índice invertido género -> posiciones de fila
+
+        Equivale a una matriz de pertenencia dispersa: una vez
+        construido (un solo groupby), seleccionar las filas de un género
+        es un lookup de diccionario más un iloc posicional, sin volver a
+        escanear la tabla explotada.
+
+        Returns:
+            dict: Género -> array de posiciones en la tabla explotada
+        """
+        if self._genre_positions is None:
+            self._genre_positions = (self._get_exploded()
+                                     .groupby('Genres_list').indices)
+        return self._genre_positions
+
+    def analyze_all(self, top_n=20):
+        """
+        Ejecuta todos los análisis compartiendo una sola pasada de datos
+
+        Fusiona el juego más jugado, el top de géneros, los ratings por
+        género y las estadísticas generales: la tabla explotada
+        (género, jugadas, rating) se construye una única vez y un solo
+        groupby alimenta tanto el ranking de jugadas como el resumen de
+        ratings, en lugar de reescanear el DataFrame por cada análisis.
+
+        Args:
+            top_n (int): Número de géneros principales a considerar
+
+        Returns:
+            dict: Diccionario con 'most_played', 'genres_df',
+                'ratings_summary' y 'stats'
+        """
+        logger.info("Ejecutando análisis fusionado en una sola pasada...")
+
+        most_played = self.get_most_played_game()
+
+        # Una sola tabla (género, jugadas, rating) compartida por todos
+        # los análisis por género
+        exploded = self._get_exploded()
+        genre_stats = exploded.groupby('Genres_list').agg(
+            Total_Plays=('Plays_numeric', 'sum'),
+            Average_Rating=('Rating', 'mean'),
+            Game_Count=('Plays_numeric', 'size')
+        )
+
+        genres_df = (genre_stats['Total_Plays']
+                     .sort_values(ascending=False)
+                     .head(top_n)
+                     .rename_axis('Genre')
+                     .reset_index())
+
+        # Alimentar el caché para llamadas posteriores a get_top_genres
+        self._top_genres_cache.setdefault(top_n, genres_df)
+
+        ratings_summary = (genre_stats.loc[genres_df['Genre'], ['Average_Rating', 'Game_Count']]
+                           .dropna(subset=['Average_Rating'])
+                           .sort_values('Average_Rating', ascending=False)
+                           .rename_axis('Genre')
+                           .reset_index())
+
+        stats = {
+            'total_games': len(self.df),
+            'total_plays': self.df['Plays_numeric'].sum(),
+            'average_rating': self.df['Rating'].mean(),
+            'max_rating': self.df['Rating'].max(),
+            'min_rating': self.df['Rating'].min(),
+            'unique_genres': int(exploded['Genres_list'].nunique())
+        }
+
+        logger.info("Análisis fusionado completado")
+        return {
+            'most_played': most_played,
+            'genres_df': genres_df,
+            'ratings_summary': ratings_summary,
+            'stats': stats
+        }
+
+    def get_most_played_game(self):
+        """
+        Encuentra el juego más jugado
+        
+        Returns:
+            dict: Información del juego más jugado
+        """
+        logger.info("Buscando el juego más jugado...")
+        # argmax directo sobre el array: evita el idxmax de pandas y el
+        # lookup posterior por etiqueta de índice
+        most_played = self.df.iloc[int(self.df['Plays_numeric'].to_numpy().argmax())]
+        
+        result = {
+            'title': most_played['Title'],
+            'plays': most_played['Plays'],
+            'plays_numeric': most_played['Plays_numeric'],
+            'rating': most_played['Rating'],
+            'genres': most_played['Genres'],
+            'platforms': most_played['Platforms'],
+            'release_date': most_played['Release_Date']
+        }
+        
+        logger.info(f"Juego más jugado: {result['title']} con {result['plays']} jugadas")
+        return result
+    
+    def get_top_genres(self, top_n=20):
+        """
+        Obtiene los géneros más jugados
+        
+        Args:
+            top_n (int): Número de géneros a devolver
+            
+        Returns:
+            pd.DataFrame: DataFrame con géneros y total de jugadas
+        """
+        if top_n in self._top_genres_cache:
+            logger.info(f"Top {top_n} géneros obtenidos desde caché")
+            return self._top_genres_cache[top_n]
+
+        logger.info(f"Calculando top {top_n} géneros más jugados...")
+
+        # Agregar de forma vectorizada sobre la tabla explotada
+        # compartida, en lugar de recorrer el DataFrame fila a fila
+        genres_df = (self._get_exploded()
+                     .groupby('Genres_list')['Plays_numeric']
+                     .sum()
+                     .sort_values(ascending=False)
+                     .head(top_n)
+                     .rename_axis('Genre')
+                     .reset_index(name='Total_Plays'))
+
+        self._top_genres_cache[top_n] = genres_df
+        logger.info(f"Top {top_n} géneros calculados")
+        return genres_df
+    
+    def get_top_rated_by_genre(self, genres_df, top_n=10):
+        """
+        Obtiene los juegos mejor valorados para los géneros principales
+        
+        Args:
+            genres_df (pd.DataFrame): DataFrame con los géneros principales
+            top_n (int): Número de juegos por género
+            
+        Returns:
+            pd.DataFrame: DataFrame con juegos mejor valorados por género
+        """
+        logger.info("Calculando juegos mejor valorados por género...")
+        
+        top_genres_list = genres_df['Genre'].tolist()
+
+        # Un único ordenamiento global por rating seguido de head por
+        # grupo sustituye al nlargest por género dentro de un bucle;
+        # las filas sin rating se excluyen, igual que hacía nlargest
+        exploded = self._get_exploded()
+        top_rows = (exploded[exploded['Genres_list'].isin(top_genres_list)]
+                    .dropna(subset=['Rating'])
+                    .sort_values('Rating', ascending=False, kind='stable')
+                    .groupby('Genres_list', sort=False)
+                    .head(top_n)
+                    .loc[:, ['Genres_list', 'Title', 'Rating', 'Plays_numeric']]
+                    .rename(columns={'Genres_list': 'Genre',
+                                     'Plays_numeric': 'Plays'}))
+
+        # Reordenar los grupos según el ranking de géneros recibido
+        top_rows['Genre'] = pd.Categorical(top_rows['Genre'],
+                                           categories=top_genres_list)
+        ratings_df = (top_rows
+                      .sort_values(['Genre', 'Rating'],
+                                   ascending=[True, False], kind='stable')
+                      .reset_index(drop=True))
+        logger.info(f"Análisis de valoraciones por género completado")
+        return ratings_df
+    
+    def get_genre_rating_summary(self, genres_df):
+        """
+        Obtiene un resumen de ratings promedio por género
+        
+        Args:
+            genres_df (pd.DataFrame): DataFrame con los géneros principales
+            
+        Returns:
+            pd.DataFrame: DataFrame con género y rating promedio
+        """
+        logger.info("Calculando ratings promedio por género...")
+        
+        top_genres_list = genres_df['Genre'].tolist()
+        exploded = self._get_exploded()
+
+        # Un solo groupby calcula media y conteo de todos los géneros en
+        # una pasada, en lugar de un filtro + mean por género; la media
+        # ignora NaN, y los géneros sin ningún rating válido (media NaN)
+        # se descartan igual que antes
+        ratings_summary = (
+            exploded[exploded['Genres_list'].isin(top_genres_list)]
+            .groupby('Genres_list').agg(
+                Average_Rating=('Rating', 'mean'),
+                Game_Count=('Rating', 'size'))
+            .dropna(subset=['Average_Rating'])
+            .sort_values('Average_Rating', ascending=False)
+            .rename_axis('Genre')
+            .reset_index())
+        
+        logger.info("Resumen de ratings calculado")
+        return ratings_summary
+    
+    def get_summary_statistics(self):
+        """
+        Genera estadísticas generales del dataset
+        
+        Returns:
+            dict: Diccionario con estadísticas
+        """
+        stats = {
+            'total_games': len(self.df),
+            'total_plays': self.df['Plays_numeric'].sum(),
+            'average_rating': self.df['Rating'].mean(),
+            'max_rating': self.df['Rating'].max(),
+            'min_rating': self.df['Rating'].min(),
+            # nunique sobre la tabla explotada compartida: cuenta en C
+            # en lugar de acumular un set de Python elemento a elemento
+            'unique_genres': int(self._get_exploded()['Genres_list'].nunique())
+        }
+        return stats
+    
+    def get_top_games_by_genre(self, genre, top_n=5):
+        """
+        Obtiene los top N juegos más jugados para un género específico
+        
+        Args:
+            genre (str): Nombre del género
+            top_n (int): Número de juegos a devolver
+            
+        Returns:
+            pd.DataFrame: DataFrame con los top juegos del género
+        """
+        cache_key = (genre, top_n)
+        if cache_key in self._top_games_cache:
+            logger.info(f"Top {top_n} juegos de {genre} obtenidos desde caché")
+            return self._top_games_cache[cache_key]
+
+        logger.info(f"Obteniendo top {top_n} juegos para género: {genre}")
+
+        # Selección O(1) vía el índice invertido género -> posiciones
+        exploded = self._get_exploded()
+        positions = self._get_genre_positions().get(genre)
+        genre_games = (exploded.iloc[positions] if positions is not None
+                       else exploded.iloc[:0])
+
+        # Ordenar por número de jugadas y tomar top N
+        top_games = genre_games.nlargest(top_n, 'Plays_numeric')[['Title', 'Plays', 'Plays_numeric', 'Rating']]
+
+        self._top_games_cache[cache_key] = top_games
+        logger.info(f"Top {top_n} juegos de {genre} obtenidos")
+        return top_games
+    
+    def get_top_games_multiple_genres(self, genres_list, top_n=5):
+        """
+        Obtiene los top N juegos para múltiples géneros
+
+        Args:
+            genres_list (list): Lista de nombres de géneros
+            top_n (int): Número de juegos por género
+
+        Returns:
+            pd.DataFrame: Tabla única con columnas Genre, Title, Plays,
+                Plays_numeric y Rating, ordenada por género (en el orden
+                solicitado) y jugadas descendentes
+        """
+        logger.info(f"Obteniendo top {top_n} juegos para {len(genres_list)} géneros...")
+
+        # Una sola pasada: filtrar los géneros solicitados sobre la
+        # tabla explotada compartida, ordenar una vez y quedarse con
+        # los top N de cada grupo. El resultado es una única tabla
+        # "tidy" con columna Genre, en lugar de un diccionario de
+        # DataFrames por género.
+        exploded = self._get_exploded()
+        top_rows = (exploded[exploded['Genres_list'].isin(genres_list)]
+                    .sort_values('Plays_numeric', ascending=False, kind='stable')
+                    .groupby('Genres_list', sort=False)
+                    .head(top_n)
+                    .rename(columns={'Genres_list': 'Genre'}))
+
+        # Ordenar los grupos según el orden de genres_list
+        top_rows['Genre'] = pd.Categorical(top_rows['Genre'], categories=genres_list)
+        top_games = (top_rows
+                     .sort_values(['Genre', 'Plays_numeric'],
+                                  ascending=[True, False], kind='stable')
+                     .reset_index(drop=True))
+
+        # Alimentar el caché por género para lookups individuales
+        for genre, group in top_games.groupby('Genre', observed=True, sort=False):
+            self._top_games_cache[(genre, top_n)] = (
+                group[['Title', 'Plays', 'Plays_numeric', 'Rating']])
+
+        logger.info(f"Análisis completado para todos los géneros")
+        return top_games